@@ -8,12 +8,26 @@ Projet:banking api streamlit - ESG 2025
 """
 
 import streamlit as st
+import altair as alt
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import numpy as np
+import orjson
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
+import plotly.io as pio
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv
+from concurrent.futures import Future, ThreadPoolExecutor
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 from typing import Dict, Any, List, Optional
-import json
+import io
+import os
+import threading
 
 # Configuration de la page
 st.set_page_config(
@@ -26,13 +40,89 @@ st.set_page_config(
 # URL de base de l'API
 API_BASE_URL = "http://localhost:8000/api"
 
+# HTTP/2 (httpx) pour les GET : à activer uniquement si l'API est servie en HTTP/2
+# (ex. hypercorn), via BANKING_API_HTTP2=1
+API_HTTP2 = os.environ.get("BANKING_API_HTTP2", "0") == "1"
+
+# Durées de cache des réponses GET (secondes)
+CACHE_TTL_SHORT = 5
+CACHE_TTL = 60
+CACHE_TTL_LONG = 300
+HEALTH_CHECK_TTL = 10
+
+# Timeouts des appels à l'API (secondes) : (connexion, lecture)
+API_TIMEOUT = (1.0, 10.0)
+HEALTH_CHECK_TIMEOUT = 0.5
+
+# Erreurs d'appel API affichées à l'utilisateur (réseau, statut HTTP, JSON invalide)
+API_ERRORS = (requests.exceptions.RequestException, httpx.HTTPError, orjson.JSONDecodeError)
+API_TIMEOUT_ERRORS = (requests.exceptions.Timeout, httpx.TimeoutException)
+
+# Nombre de figures Plotly sérialisées conservées en cache
+FIGURE_CACHE_ENTRIES = 32
+
+# Nombre maximal de points tracés par série (au-delà : sous-échantillonnage LTTB)
+MAX_PLOT_POINTS = 2000
+
+# Colonnes de montants des transactions (dataset PaySim)
+TRANSACTION_AMOUNT_COLUMNS = ['amount', 'oldbalanceOrg', 'newbalanceOrig', 'oldbalanceDest', 'newbalanceDest']
+
+# Données de référence conservées dans st.session_state : clé -> endpoint
+SESSION_DATA_ENDPOINTS = {
+    "_types": "transactions/types",
+    "_metadata": "system/metadata",
+}
+
+# Niveau de cache par endpoint ("short", "default" ou "long") ; "default" si absent
+ENDPOINT_CACHE_TIERS = {
+    "system/health": "short",
+    "transactions/types": "long",
+    "stats/by-type": "long",
+}
+
 
 # ==================== FONCTIONS UTILITAIRES ====================
 
+# Ressources partagées par tout le processus : st.cache_resource garantit une
+# instance unique, qui survit aux reruns et est commune à toutes les sessions.
+
+@st.cache_resource
+def _http() -> requests.Session:
+    """Session HTTP partagée (keep-alive, pool de connexions)."""
+    session = requests.Session()
+    session.headers.update({"Connection": "keep-alive"})
+    # Une seule nouvelle tentative, uniquement sur échec de connexion (requête non envoyée), sans backoff
+    retry = Retry(total=1, connect=1, read=False, status=0, other=0, backoff_factor=0)
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=32, max_retries=retry)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+@st.cache_resource
+def _http2() -> httpx.Client:
+    """Client HTTP/2 partagé : les GET parallèles sont multiplexés sur une seule connexion."""
+    # En clair (http://), HTTP/2 n'est possible qu'en « prior knowledge » (h2c, sans HTTP/1.1)
+    return httpx.Client(
+        http1=API_BASE_URL.startswith("https://"),
+        http2=True,
+        base_url=API_BASE_URL,
+        limits=httpx.Limits(max_keepalive_connections=10),
+        timeout=httpx.Timeout(API_TIMEOUT[1], connect=API_TIMEOUT[0])
+    )
+
+
+@st.cache_resource
+def _pool() -> ThreadPoolExecutor:
+    """Pool de threads partagé pour paralléliser les appels à l'API."""
+    return ThreadPoolExecutor(max_workers=8)
+
+
+@st.cache_data(ttl=HEALTH_CHECK_TTL, show_spinner=False)
 def check_api_health() -> bool:
     """Vérifie que l'API est accessible."""
     try:
-        response = requests.get(f"{API_BASE_URL}/system/health", timeout=2)
+        response = _http().get(f"{API_BASE_URL}/system/health", timeout=HEALTH_CHECK_TIMEOUT)
         return response.status_code == 200
     except:
         return False
@@ -43,91 +133,478 @@ def format_number(num: float) -> str:
     return f"{num:,.2f}"
 
 
-def get_api_data(endpoint: str, params: Optional[Dict] = None) -> Optional[Dict]:
-    """Récupère des données depuis l'API."""
+def count_column() -> Dict:
+    """Format entier, appliqué par la grille st.dataframe côté navigateur."""
+    return st.column_config.NumberColumn(format="%d")
+
+
+def amount_column() -> Dict:
+    """Format monétaire, appliqué par la grille st.dataframe côté navigateur."""
+    return st.column_config.NumberColumn(format="$%.2f")
+
+
+def percent_column() -> Dict:
+    """Format pourcentage (valeur déjà exprimée en %), appliqué côté navigateur."""
+    return st.column_config.NumberColumn(format="%.2f%%")
+
+
+def transaction_column_config() -> Dict:
+    """column_config des tableaux de transactions."""
+    return {column: amount_column() for column in TRANSACTION_AMOUNT_COLUMNS}
+
+
+def _fetch_json(endpoint: str, params: Optional[Dict] = None) -> Any:
+    """Effectue un GET sur l'API et renvoie le JSON (lève une exception en cas d'erreur)."""
+    if API_HTTP2:
+        response = _http2().get(endpoint, params=params)
+    else:
+        response = _http().get(f"{API_BASE_URL}/{endpoint}", params=params, timeout=API_TIMEOUT)
+    response.raise_for_status()
+    return orjson.loads(response.content)
+
+
+@st.cache_data(ttl=CACHE_TTL_SHORT, show_spinner=False)
+def _cached_get_short(endpoint: str, params_key: tuple) -> Any:
+    return _fetch_json(endpoint, dict(params_key))
+
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def _cached_get(endpoint: str, params_key: tuple) -> Any:
+    return _fetch_json(endpoint, dict(params_key))
+
+
+@st.cache_data(ttl=CACHE_TTL_LONG, show_spinner=False)
+def _cached_get_long(endpoint: str, params_key: tuple) -> Any:
+    return _fetch_json(endpoint, dict(params_key))
+
+
+_CACHED_GETTERS = {
+    "short": _cached_get_short,
+    "default": _cached_get,
+    "long": _cached_get_long,
+}
+
+
+def _get_cached(endpoint: str, params: Optional[Dict] = None, cache_tier: Optional[str] = None) -> Any:
+    """GET mis en cache ; le niveau dépend de l'endpoint sauf si `cache_tier` est précisé."""
+    if cache_tier is None:
+        cache_tier = ENDPOINT_CACHE_TIERS.get(endpoint, "default")
+    if cache_tier not in _CACHED_GETTERS:
+        raise ValueError(f"Niveau de cache inconnu : {cache_tier!r} (attendu : {', '.join(_CACHED_GETTERS)})")
+    params_key = tuple(sorted((params or {}).items()))
+    return _CACHED_GETTERS[cache_tier](endpoint, params_key)
+
+
+def get_api_data(
+    endpoint: str,
+    params: Optional[Dict] = None,
+    cache_tier: Optional[str] = None,
+    cached: bool = True
+) -> Optional[Dict]:
+    """Récupère des données depuis l'API (mises en cache sauf si `cached=False`, voir ENDPOINT_CACHE_TIERS)."""
     try:
-        response = requests.get(f"{API_BASE_URL}/{endpoint}", params=params)
-        response.raise_for_status()
-        return response.json()
-    except requests.exceptions.RequestException as e:
+        if not cached:
+            return _fetch_json(endpoint, params)
+        return _get_cached(endpoint, params, cache_tier)
+    except API_TIMEOUT_ERRORS:
+        st.error(f"⏱️ Délai dépassé : l'API n'a pas répondu à temps ({endpoint})")
+        return None
+    except API_ERRORS as e:
         st.error(f"❌ Erreur API: {str(e)}")
         return None
 
 
+def _submit(fn, *args) -> Future:
+    """Soumet `fn` au pool partagé en propageant le contexte Streamlit au thread."""
+    ctx = get_script_run_ctx()
+
+    def _run() -> Any:
+        add_script_run_ctx(threading.current_thread(), ctx)
+        return fn(*args)
+
+    return _pool().submit(_run)
+
+
+def get_session_data(key: str) -> Optional[Dict]:
+    """Donnée de référence récupérée une fois par session puis lue dans st.session_state."""
+    if key not in st.session_state:
+        data = get_api_data(SESSION_DATA_ENDPOINTS[key])
+        if data is None:
+            # Échec non mémorisé : nouvel essai au prochain rerun
+            return None
+        st.session_state[key] = data
+    return st.session_state[key]
+
+
+def get_transaction_types() -> Optional[Dict]:
+    """Types de transactions disponibles (GET /transactions/types)."""
+    return get_session_data("_types")
+
+
+def get_metadata() -> Optional[Dict]:
+    """Métadonnées de l'API (GET /system/metadata)."""
+    return get_session_data("_metadata")
+
+
+def fetch_many(endpoints: List[str]) -> Dict[str, Any]:
+    """Récupère plusieurs endpoints en parallèle, résultats indexés par endpoint."""
+    futures = {endpoint: _submit(_get_cached, endpoint) for endpoint in endpoints}
+
+    results = {}
+    for endpoint, future in futures.items():
+        try:
+            results[endpoint] = future.result()
+        except API_TIMEOUT_ERRORS:
+            st.error(f"⏱️ Délai dépassé : l'API n'a pas répondu à temps ({endpoint})")
+            results[endpoint] = None
+        except API_ERRORS as e:
+            st.error(f"❌ Erreur API: {str(e)}")
+            results[endpoint] = None
+    return results
+
+
+def prefetch(endpoint: str, params: Optional[Dict] = None) -> None:
+    """Précharge un GET en arrière-plan : le résultat alimente le cache, les erreurs sont ignorées."""
+    _submit(_get_cached, endpoint, params)
+
+
+def records_to_table(records: List[Dict]) -> pa.Table:
+    """Convertit les enregistrements JSON en table Arrow, transmise telle quelle à st.dataframe."""
+    # Colonnes : union des clés de tous les enregistrements (pas seulement du premier)
+    columns = list(dict.fromkeys(key for record in records for key in record))
+
+    arrays = {}
+    for column in columns:
+        values = [record.get(column) for record in records]
+        try:
+            arrays[column] = pa.array(values)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            # Colonne aux types mélangés : affichée en texte, comme le fait st.dataframe pour pandas
+            arrays[column] = pa.array([None if value is None else str(value) for value in values])
+    return pa.Table.from_pydict(arrays)
+
+
+def table_to_csv(table: pa.Table) -> bytes:
+    """Sérialise une table Arrow en CSV (writer C de pyarrow)."""
+    buffer = io.BytesIO()
+    pyarrow.csv.write_csv(table, buffer)
+    return buffer.getvalue()
+
+
+def lttb_indices(x: Any, y: Any, threshold: int = MAX_PLOT_POINTS) -> np.ndarray:
+    """Indices des points conservés par l'algorithme Largest-Triangle-Three-Buckets."""
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+
+    # Premier et dernier points conservés, le reste découpé en threshold - 2 buckets
+    edges = np.linspace(1, n - 1, threshold - 1).astype(int)
+    indices = np.empty(threshold, dtype=int)
+    indices[0], indices[-1] = 0, n - 1
+
+    a = 0
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        if i + 2 < len(edges):
+            avg_x = x[end:edges[i + 2]].mean()
+            avg_y = y[end:edges[i + 2]].mean()
+        else:
+            avg_x, avg_y = x[-1], y[-1]
+
+        # Point du bucket formant le plus grand triangle avec le point précédent et la moyenne suivante
+        areas = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a])
+            - (x[a] - x[start:end]) * (avg_y - y[a])
+        )
+        a = start + int(np.argmax(areas))
+        indices[i + 1] = a
+
+    return indices
+
+
 def post_api_data(endpoint: str, data: Dict) -> Optional[Dict]:
     """Envoie des données en POST à l'API."""
     try:
-        response = requests.post(f"{API_BASE_URL}/{endpoint}", json=data)
+        response = _http().post(
+            f"{API_BASE_URL}/{endpoint}",
+            data=orjson.dumps(data),
+            headers={"Content-Type": "application/json"},
+            timeout=API_TIMEOUT
+        )
         response.raise_for_status()
-        return response.json()
-    except requests.exceptions.RequestException as e:
+        return orjson.loads(response.content)
+    except API_TIMEOUT_ERRORS:
+        st.error(f"⏱️ Délai dépassé : l'API n'a pas répondu à temps ({endpoint})")
+        return None
+    except API_ERRORS as e:
         st.error(f"❌ Erreur API: {str(e)}")
         return None
 
 
-# ==================== HEADER ====================
+# ==================== FIGURES PLOTLY (MÉMOÏSÉES) ====================
+# Les figures ne dépendant que des données de l'API sont construites une seule
+# fois par jeu de données et conservées sous forme JSON.
 
-st.title("🏦 Banking Transactions API - Interface de Test")
-st.markdown("---")
+@st.cache_data(show_spinner=False, max_entries=FIGURE_CACHE_ENTRIES)
+def bar_figure_json(
+    df: pd.DataFrame,
+    x: str,
+    y: str,
+    title: str,
+    labels: Optional[Dict] = None,
+    color: Optional[str] = None,
+    color_continuous_scale: Optional[str] = None,
+    color_discrete_map: Optional[Dict] = None
+) -> str:
+    """Diagramme en barres px.bar, sérialisé en JSON."""
+    fig = px.bar(
+        df,
+        x=x,
+        y=y,
+        color=color,
+        title=title,
+        labels=labels,
+        color_continuous_scale=color_continuous_scale,
+        color_discrete_map=color_discrete_map
+    )
+    return fig.to_json()
 
-# Vérification de l'état de l'API
-col1, col2, col3 = st.columns([2, 1, 1])
 
-with col1:
-    if check_api_health():
-        st.success("✅ API connectée et fonctionnelle")
-    else:
-        st.error("❌ API non accessible. Assurez-vous que l'API tourne sur http://localhost:8000")
-        st.info("💡 Lancez l'API avec : `uvicorn banking_api.main:app --reload`")
-        st.stop()
+@st.cache_data(show_spinner=False, max_entries=FIGURE_CACHE_ENTRIES)
+def daily_figure_json(df_daily: pd.DataFrame) -> str:
+    """Évolution quotidienne à double axe (séries sous-échantillonnées si trop de points), sérialisée en JSON."""
+    mode = 'lines+markers' if len(df_daily) <= MAX_PLOT_POINTS else 'lines'
+    count_idx = lttb_indices(df_daily['day'], df_daily['count'])
+    amount_idx = lttb_indices(df_daily['day'], df_daily['avg_amount'])
 
-with col2:
-    metadata = get_api_data("system/metadata")
-    if metadata:
-        st.info(f"📦 Version: {metadata.get('version', 'N/A')}")
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=df_daily['day'].iloc[count_idx],
+        y=df_daily['count'].iloc[count_idx],
+        mode=mode,
+        name='Nombre de transactions',
+        yaxis='y1'
+    ))
+    fig.add_trace(go.Scatter(
+        x=df_daily['day'].iloc[amount_idx],
+        y=df_daily['avg_amount'].iloc[amount_idx],
+        mode=mode,
+        name='Montant moyen',
+        yaxis='y2'
+    ))
 
-with col3:
-    st.info(f"🔗 Base URL: `{API_BASE_URL}`")
+    fig.update_layout(
+        title="Évolution quotidienne des transactions",
+        xaxis_title="Jour (step)",
+        yaxis=dict(title="Nombre de transactions"),
+        yaxis2=dict(title="Montant moyen ($)", overlaying='y', side='right')
+    )
+    return fig.to_json()
 
-st.markdown("---")
 
+# ==================== AFFICHAGE (FRAGMENTS) ====================
+# Chaque bloc graphique ou export est un fragment : une interaction dans l'un
+# d'eux ne relance que ce fragment (avec les mêmes arguments), pas toute la page.
 
-# ==================== SIDEBAR ====================
+def deferred_chart_slot(key: str):
+    """Emplacement du graphique s'il a été demandé via l'interrupteur, sinon None."""
+    if not st.toggle("Afficher le graphique", key=key):
+        return None
+    slot = st.empty()
+    slot.info("⏳ Chargement du graphique...")
+    return slot
 
-st.sidebar.title("📋 Navigation")
-menu = st.sidebar.radio(
-    "Choisissez une section :",
-    [
-        "📊 Vue d'ensemble",
-        "💳 Transactions",
-        "📈 Statistiques",
-        "🚨 Détection de Fraude",
-        "👥 Clients",
-        "🔍 Recherche Avancée",
-        "🧪 Test des Routes"
-    ]
-)
 
-st.sidebar.markdown("---")
-st.sidebar.markdown("### 🎯 Points testés")
-st.sidebar.markdown("""
-- ✅ GET /transactions
-- ✅ GET /stats/overview
-- ✅ GET /fraud/summary
-- ✅ POST /fraud/predict
-- ✅ GET /customers
-- ✅ POST /transactions/search
-""")
+@st.fragment
+def render_amount_distribution(dist_data: Dict) -> None:
+    """Histogramme des montants (Vue d'ensemble)."""
+    slot = deferred_chart_slot("show_amount_distribution")
+    if slot is None:
+        return
+
+    df_dist = pd.DataFrame({'bins': dist_data['bins'], 'counts': dist_data['counts']})
+    chart = alt.Chart(df_dist, title="Répartition des transactions par montant").mark_bar().encode(
+        x=alt.X('bins:N', sort=None, title='Plage de montant'),
+        y=alt.Y('counts:Q', title='Nombre de transactions'),
+        tooltip=['bins', 'counts']
+    )
+    slot.altair_chart(chart, use_container_width=True)
+
+
+@st.fragment
+def render_types_pie(stats_by_type: List[Dict]) -> None:
+    """Camembert de répartition par type (Vue d'ensemble)."""
+    slot = deferred_chart_slot("show_types_pie")
+    if slot is None:
+        return
+
+    df_types = pd.DataFrame(stats_by_type)
+    chart = alt.Chart(df_types, title="Répartition par type de transaction").mark_arc().encode(
+        theta=alt.Theta('count:Q'),
+        color=alt.Color('type:N', title='Type'),
+        tooltip=['type', 'count']
+    )
+    slot.altair_chart(chart, use_container_width=True)
+
+
+@st.fragment
+def render_fraud_rate_by_type(fraud_by_type: List[Dict]) -> None:
+    """Taux de fraude par type (Vue d'ensemble)."""
+    slot = deferred_chart_slot("show_fraud_rate_by_type")
+    if slot is None:
+        return
+
+    df_fraud = pd.DataFrame(fraud_by_type)
+    chart = alt.Chart(df_fraud, title="Taux de fraude par type de transaction").mark_bar().encode(
+        x=alt.X('type:N', title='Type de transaction'),
+        y=alt.Y('fraud_rate:Q', title='Taux de fraude (%)'),
+        color=alt.Color('fraud_rate:Q', scale=alt.Scale(scheme='reds'), title='Taux de fraude (%)'),
+        tooltip=['type', 'fraud_rate']
+    )
+    slot.altair_chart(chart, use_container_width=True)
+
+
+@st.fragment
+def render_stats_by_type(stats_by_type: List[Dict]) -> None:
+    """Onglet Statistiques > Par Type."""
+    df_stats = pd.DataFrame(stats_by_type)
+
+    # Tableau
+    st.dataframe(
+        df_stats,
+        column_config={
+            'count': count_column(),
+            'avg_amount': amount_column(),
+            'total_amount': amount_column()
+        },
+        use_container_width=True
+    )
+
+    # Graphiques
+    col1, col2 = st.columns(2)
+
+    with col1:
+        fig_json = bar_figure_json(
+            df_stats,
+            x='type',
+            y='count',
+            title="Nombre de transactions par type",
+            labels={'count': 'Nombre', 'type': 'Type'}
+        )
+        st.plotly_chart(pio.from_json(fig_json), use_container_width=True)
+
+    with col2:
+        fig_json = bar_figure_json(
+            df_stats,
+            x='type',
+            y='avg_amount',
+            title="Montant moyen par type",
+            labels={'avg_amount': 'Montant moyen ($)', 'type': 'Type'}
+        )
+        st.plotly_chart(pio.from_json(fig_json), use_container_width=True)
+
+
+@st.fragment
+def render_daily_stats(daily_stats: List[Dict]) -> None:
+    """Onglet Statistiques > Quotidiennes."""
+    df_daily = pd.DataFrame(daily_stats)
+
+    # Graphique d'évolution
+    st.plotly_chart(pio.from_json(daily_figure_json(df_daily)), use_container_width=True)
+
+    # Tableau détaillé
+    st.dataframe(
+        df_daily,
+        column_config={
+            'count': count_column(),
+            'avg_amount': amount_column(),
+            'total_amount': amount_column()
+        },
+        use_container_width=True
+    )
+
+
+@st.fragment
+def render_distribution_details(dist_data: Dict) -> None:
+    """Onglet Statistiques > Distribution."""
+    df_dist = pd.DataFrame({
+        'Plage': dist_data['bins'],
+        'Nombre': dist_data['counts']
+    })
+
+    fig_json = bar_figure_json(
+        df_dist,
+        x='Plage',
+        y='Nombre',
+        title="Distribution des montants de transactions"
+    )
+    st.plotly_chart(pio.from_json(fig_json), use_container_width=True)
+
+    st.dataframe(df_dist, use_container_width=True)
+
+
+@st.fragment
+def render_fraud_analysis(fraud_by_type: List[Dict]) -> None:
+    """Détection de Fraude > Analyse par type (tableau + graphique)."""
+    df_fraud = pd.DataFrame(fraud_by_type)
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.dataframe(
+            df_fraud,
+            column_config={
+                'total_transactions': count_column(),
+                'fraud_count': count_column(),
+                'fraud_rate': percent_column()
+            },
+            use_container_width=True
+        )
+
+    with col2:
+        fig_json = bar_figure_json(
+            df_fraud,
+            x='type',
+            y='fraud_count',
+            color='fraud_rate',
+            title="Nombre de fraudes par type",
+            labels={'fraud_count': 'Nombre de fraudes', 'type': 'Type'},
+            color_continuous_scale='Reds'
+        )
+        st.plotly_chart(pio.from_json(fig_json), use_container_width=True)
+
+
+@st.fragment
+def render_csv_export(table: pa.Table, file_name: str, label: str) -> None:
+    """Export CSV à la demande : le fichier n'est généré qu'au clic sur « Préparer CSV »."""
+    if st.button("📥 Préparer CSV", key=f"prepare_{file_name}"):
+        st.download_button(
+            label=label,
+            data=table_to_csv(table),
+            file_name=file_name,
+            mime="text/csv"
+        )
 
 
 # ==================== VUE D'ENSEMBLE ====================
 
-if menu == "📊 Vue d'ensemble":
+def render_overview() -> None:
+    """Page « Vue d'ensemble » : KPIs et graphiques principaux."""
     st.header("📊 Vue d'Ensemble du Système")
     
-    # Récupérer les stats globales
-    overview = get_api_data("stats/overview")
-    fraud_summary = get_api_data("fraud/summary")
+    # Récupérer toutes les données de la page en parallèle
+    results = fetch_many([
+        "stats/overview",
+        "fraud/summary",
+        "stats/amount-distribution",
+        "stats/by-type",
+        "fraud/by-type",
+    ])
+    overview = results["stats/overview"]
+    fraud_summary = results["fraud/summary"]
     
     if overview and fraud_summary:
         # KPIs principaux
@@ -170,49 +647,27 @@ if menu == "📊 Vue d'ensemble":
         
         with col1:
             st.subheader("📊 Distribution des Montants")
-            dist_data = get_api_data("stats/amount-distribution")
+            dist_data = results["stats/amount-distribution"]
             if dist_data:
-                fig = px.bar(
-                    x=dist_data['bins'],
-                    y=dist_data['counts'],
-                    labels={'x': 'Plage de montant', 'y': 'Nombre de transactions'},
-                    title="Répartition des transactions par montant"
-                )
-                st.plotly_chart(fig, use_container_width=True)
+                render_amount_distribution(dist_data)
         
         with col2:
             st.subheader("📈 Statistiques par Type")
-            stats_by_type = get_api_data("stats/by-type")
+            stats_by_type = results["stats/by-type"]
             if stats_by_type:
-                df_types = pd.DataFrame(stats_by_type)
-                fig = px.pie(
-                    df_types,
-                    values='count',
-                    names='type',
-                    title="Répartition par type de transaction"
-                )
-                st.plotly_chart(fig, use_container_width=True)
+                render_types_pie(stats_by_type)
         
         # Fraude par type
         st.subheader("🚨 Taux de Fraude par Type")
-        fraud_by_type = get_api_data("fraud/by-type")
+        fraud_by_type = results["fraud/by-type"]
         if fraud_by_type:
-            df_fraud = pd.DataFrame(fraud_by_type)
-            fig = px.bar(
-                df_fraud,
-                x='type',
-                y='fraud_rate',
-                color='fraud_rate',
-                labels={'type': 'Type de transaction', 'fraud_rate': 'Taux de fraude (%)'},
-                title="Taux de fraude par type de transaction",
-                color_continuous_scale='Reds'
-            )
-            st.plotly_chart(fig, use_container_width=True)
+            render_fraud_rate_by_type(fraud_by_type)
 
 
 # ==================== TRANSACTIONS ====================
 
-elif menu == "💳 Transactions":
+def render_transactions() -> None:
+    """Page « Transactions » : liste filtrée et transactions récentes."""
     st.header("💳 Consultation des Transactions")
     
     # Filtres
@@ -226,7 +681,7 @@ elif menu == "💳 Transactions":
     
     with col3:
         # Récupérer les types disponibles
-        types_data = get_api_data("transactions/types")
+        types_data = get_transaction_types()
         if types_data:
             transaction_types = ["Tous"] + types_data.get('types', [])
             selected_type = st.selectbox("Type de transaction", transaction_types)
@@ -270,24 +725,23 @@ elif menu == "💳 Transactions":
         if data:
             st.success(f"✅ {data['total']} transactions trouvées")
             
+            # Préchargement de la page suivante pendant la consultation
+            if page * limit < data['total']:
+                prefetch("transactions", {**params, "page": page + 1})
+            
             if data['transactions']:
-                df = pd.DataFrame(data['transactions'])
+                table = records_to_table(data['transactions'])
                 
                 # Formater l'affichage
                 st.dataframe(
-                    df,
+                    table,
+                    column_config=transaction_column_config(),
                     use_container_width=True,
                     height=400
                 )
                 
                 # Téléchargement CSV
-                csv = df.to_csv(index=False)
-                st.download_button(
-                    label="📥 Télécharger en CSV",
-                    data=csv,
-                    file_name="transactions.csv",
-                    mime="text/csv"
-                )
+                render_csv_export(table, "transactions.csv", "📥 Télécharger en CSV")
             else:
                 st.warning("Aucune transaction trouvée avec ces critères")
     
@@ -298,131 +752,54 @@ elif menu == "💳 Transactions":
     n_recent = st.slider("Nombre de transactions", min_value=5, max_value=50, value=10)
     
     if st.button("Afficher les transactions récentes"):
-        recent_data = get_api_data("transactions/recent", params={"n": n_recent})
+        recent_data = get_api_data("transactions/recent", params={"n": n_recent}, cache_tier="short")
         
         if recent_data and recent_data.get('transactions'):
-            df_recent = pd.DataFrame(recent_data['transactions'])
-            st.dataframe(df_recent, use_container_width=True)
+            st.dataframe(records_to_table(recent_data['transactions']), use_container_width=True)
 
 
 # ==================== STATISTIQUES ====================
 
-elif menu == "📈 Statistiques":
+def render_statistics() -> None:
+    """Page « Statistiques » : par type, quotidiennes, distribution."""
     st.header("📈 Statistiques Détaillées")
     
+    results = fetch_many(["stats/by-type", "stats/daily", "stats/amount-distribution"])
+    
     tab1, tab2, tab3 = st.tabs(["📊 Par Type", "📅 Quotidiennes", "💰 Distribution"])
     
     with tab1:
         st.subheader("Statistiques par Type de Transaction")
-        stats_by_type = get_api_data("stats/by-type")
+        stats_by_type = results["stats/by-type"]
         
         if stats_by_type:
-            df_stats = pd.DataFrame(stats_by_type)
-            
-            # Tableau
-            st.dataframe(
-                df_stats.style.format({
-                    'count': '{:,}',
-                    'avg_amount': '${:,.2f}',
-                    'total_amount': '${:,.2f}'
-                }),
-                use_container_width=True
-            )
-            
-            # Graphiques
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                fig = px.bar(
-                    df_stats,
-                    x='type',
-                    y='count',
-                    title="Nombre de transactions par type",
-                    labels={'count': 'Nombre', 'type': 'Type'}
-                )
-                st.plotly_chart(fig, use_container_width=True)
-            
-            with col2:
-                fig = px.bar(
-                    df_stats,
-                    x='type',
-                    y='avg_amount',
-                    title="Montant moyen par type",
-                    labels={'avg_amount': 'Montant moyen ($)', 'type': 'Type'}
-                )
-                st.plotly_chart(fig, use_container_width=True)
+            render_stats_by_type(stats_by_type)
     
     with tab2:
         st.subheader("Statistiques Quotidiennes (par step)")
-        daily_stats = get_api_data("stats/daily")
+        daily_stats = results["stats/daily"]
         
         if daily_stats:
-            df_daily = pd.DataFrame(daily_stats)
-            
-            # Graphique d'évolution
-            fig = go.Figure()
-            fig.add_trace(go.Scatter(
-                x=df_daily['day'],
-                y=df_daily['count'],
-                mode='lines+markers',
-                name='Nombre de transactions',
-                yaxis='y1'
-            ))
-            fig.add_trace(go.Scatter(
-                x=df_daily['day'],
-                y=df_daily['avg_amount'],
-                mode='lines+markers',
-                name='Montant moyen',
-                yaxis='y2'
-            ))
-            
-            fig.update_layout(
-                title="Évolution quotidienne des transactions",
-                xaxis_title="Jour (step)",
-                yaxis=dict(title="Nombre de transactions"),
-                yaxis2=dict(title="Montant moyen ($)", overlaying='y', side='right')
-            )
-            
-            st.plotly_chart(fig, use_container_width=True)
-            
-            # Tableau détaillé
-            st.dataframe(
-                df_daily.style.format({
-                    'count': '{:,}',
-                    'avg_amount': '${:,.2f}',
-                    'total_amount': '${:,.2f}'
-                }),
-                use_container_width=True
-            )
+            render_daily_stats(daily_stats)
     
     with tab3:
         st.subheader("Distribution des Montants")
-        dist_data = get_api_data("stats/amount-distribution")
+        dist_data = results["stats/amount-distribution"]
         
         if dist_data:
-            df_dist = pd.DataFrame({
-                'Plage': dist_data['bins'],
-                'Nombre': dist_data['counts']
-            })
-            
-            fig = px.bar(
-                df_dist,
-                x='Plage',
-                y='Nombre',
-                title="Distribution des montants de transactions"
-            )
-            st.plotly_chart(fig, use_container_width=True)
-            
-            st.dataframe(df_dist, use_container_width=True)
+            render_distribution_details(dist_data)
+
 
 
 # ==================== DÉTECTION DE FRAUDE ====================
 
-elif menu == "🚨 Détection de Fraude":
+def render_fraud() -> None:
+    """Page « Détection de Fraude » : résumé, prédiction et analyse."""
     st.header("🚨 Détection et Analyse de Fraude")
     
-    # Résumé de fraude
-    fraud_summary = get_api_data("fraud/summary")
+    # Résumé et analyse par type récupérés en parallèle
+    results = fetch_many(["fraud/summary", "fraud/by-type"])
+    fraud_summary = results["fraud/summary"]
     
     if fraud_summary:
         col1, col2, col3, col4 = st.columns(4)
@@ -508,39 +885,16 @@ elif menu == "🚨 Détection de Fraude":
     
     # Fraude par type
     st.subheader("📊 Analyse de Fraude par Type")
-    fraud_by_type = get_api_data("fraud/by-type")
+    fraud_by_type = results["fraud/by-type"]
     
     if fraud_by_type:
-        df_fraud = pd.DataFrame(fraud_by_type)
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.dataframe(
-                df_fraud.style.format({
-                    'total_transactions': '{:,}',
-                    'fraud_count': '{:,}',
-                    'fraud_rate': '{:.2f}%'
-                }),
-                use_container_width=True
-            )
-        
-        with col2:
-            fig = px.bar(
-                df_fraud,
-                x='type',
-                y='fraud_count',
-                color='fraud_rate',
-                title="Nombre de fraudes par type",
-                labels={'fraud_count': 'Nombre de fraudes', 'type': 'Type'},
-                color_continuous_scale='Reds'
-            )
-            st.plotly_chart(fig, use_container_width=True)
+        render_fraud_analysis(fraud_by_type)
 
 
 # ==================== CLIENTS ====================
 
-elif menu == "👥 Clients":
+def render_customers() -> None:
+    """Page « Clients » : liste, top clients et profil."""
     st.header("👥 Gestion des Clients")
     
     tab1, tab2, tab3 = st.tabs(["📋 Liste", "🏆 Top Clients", "👤 Profil"])
@@ -562,6 +916,10 @@ elif menu == "👥 Clients":
             if customers_data:
                 st.info(f"Total de clients : {customers_data['total']:,}")
                 
+                # Préchargement de la page suivante pendant la consultation
+                if page * limit < customers_data['total']:
+                    prefetch("customers", {"page": page + 1, "limit": limit})
+                
                 df_customers = pd.DataFrame({
                     'ID Client': customers_data['customers']
                 })
@@ -585,17 +943,18 @@ elif menu == "👥 Clients":
                 df_top = pd.DataFrame(top_customers)
                 
                 st.dataframe(
-                    df_top.style.format({
-                        'transaction_count': '{:,}',
-                        'total_amount': '${:,.2f}',
-                        'avg_amount': '${:,.2f}',
-                        'fraud_count': '{:,}'
-                    }),
+                    df_top,
+                    column_config={
+                        'transaction_count': count_column(),
+                        'total_amount': amount_column(),
+                        'avg_amount': amount_column(),
+                        'fraud_count': count_column()
+                    },
                     use_container_width=True
                 )
                 
                 # Graphique
-                fig = px.bar(
+                fig_json = bar_figure_json(
                     df_top,
                     x='customer_id',
                     y='total_amount' if sort_by == 'volume' else 'transaction_count',
@@ -608,7 +967,7 @@ elif menu == "👥 Clients":
                     },
                     color_discrete_map={True: 'red', False: 'green'}
                 )
-                st.plotly_chart(fig, use_container_width=True)
+                st.plotly_chart(pio.from_json(fig_json), use_container_width=True)
     
     with tab3:
         st.subheader("👤 Profil Client Détaillé")
@@ -648,22 +1007,21 @@ elif menu == "👥 Clients":
                         if st.button("📤 Transactions émises"):
                             trans_data = get_api_data(f"transactions/by-customer/{customer_id}")
                             if trans_data:
-                                df_trans = pd.DataFrame(trans_data['transactions'])
-                                st.dataframe(df_trans, use_container_width=True)
+                                st.dataframe(records_to_table(trans_data['transactions']), use_container_width=True)
                     
                     with col2:
                         if st.button("📥 Transactions reçues"):
                             trans_data = get_api_data(f"transactions/to-customer/{customer_id}")
                             if trans_data:
-                                df_trans = pd.DataFrame(trans_data['transactions'])
-                                st.dataframe(df_trans, use_container_width=True)
+                                st.dataframe(records_to_table(trans_data['transactions']), use_container_width=True)
             else:
                 st.warning("Veuillez entrer un ID client")
 
 
 # ==================== RECHERCHE AVANCÉE ====================
 
-elif menu == "🔍 Recherche Avancée":
+def render_search() -> None:
+    """Page « Recherche Avancée » : recherche multicritère."""
     st.header("🔍 Recherche Multicritère")
     
     st.markdown("**Critères de recherche**")
@@ -671,7 +1029,7 @@ elif menu == "🔍 Recherche Avancée":
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        types_data = get_api_data("transactions/types")
+        types_data = get_transaction_types()
         if types_data:
             transaction_types = ["Tous"] + types_data.get('types', [])
             search_type = st.selectbox("Type", transaction_types, key="search_type")
@@ -713,37 +1071,37 @@ elif menu == "🔍 Recherche Avancée":
             st.success(f"✅ {result['count']} transactions trouvées")
             
             if result['transactions']:
-                df_search = pd.DataFrame(result['transactions'])
+                table = records_to_table(result['transactions'])
                 
-                st.dataframe(df_search, use_container_width=True, height=400)
+                st.dataframe(
+                    table,
+                    column_config=transaction_column_config(),
+                    use_container_width=True,
+                    height=400
+                )
                 
                 # Statistiques rapides
                 col1, col2, col3 = st.columns(3)
                 
                 with col1:
-                    st.metric("Nombre", len(df_search))
+                    st.metric("Nombre", table.num_rows)
                 
                 with col2:
-                    st.metric("Montant Total", f"${format_number(df_search['amount'].sum())}")
+                    st.metric("Montant Total", f"${format_number(pc.sum(table['amount']).as_py())}")
                 
                 with col3:
-                    st.metric("Montant Moyen", f"${format_number(df_search['amount'].mean())}")
+                    st.metric("Montant Moyen", f"${format_number(pc.mean(table['amount']).as_py())}")
                 
                 # Téléchargement
-                csv = df_search.to_csv(index=False)
-                st.download_button(
-                    label="📥 Télécharger les résultats (CSV)",
-                    data=csv,
-                    file_name="search_results.csv",
-                    mime="text/csv"
-                )
+                render_csv_export(table, "search_results.csv", "📥 Télécharger les résultats (CSV)")
             else:
                 st.info("Aucun résultat trouvé")
 
 
 # ==================== TEST DES ROUTES ====================
 
-elif menu == "🧪 Test des Routes":
+def render_route_tester() -> None:
+    """Page « Test des Routes » : appel manuel des endpoints."""
     st.header("🧪 Test Manuel des Routes API")
     
     st.markdown("""
@@ -817,10 +1175,11 @@ elif menu == "🧪 Test des Routes":
     # Bouton de test
     if st.button("🚀 Tester la route", type="primary"):
         try:
-            params = json.loads(params_text)
+            params = orjson.loads(params_text)
             
             if route_info["method"] == "GET":
-                result = get_api_data(route_info["endpoint"], params=params)
+                # Pas de cache : chaque test doit réellement appeler la route
+                result = get_api_data(route_info["endpoint"], params=params, cached=False)
             else:
                 result = post_api_data(route_info["endpoint"], params)
             
@@ -831,14 +1190,82 @@ elif menu == "🧪 Test des Routes":
                 st.json(result)
                 
                 # Copie facile
-                st.code(json.dumps(result, indent=2), language="json")
+                st.code(orjson.dumps(result, option=orjson.OPT_INDENT_2).decode(), language="json")
         
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             st.error("❌ JSON invalide")
         except Exception as e:
             st.error(f"❌ Erreur: {str(e)}")
 
 
+# ==================== NAVIGATION ====================
+
+PAGES = {
+    "📊 Vue d'ensemble": render_overview,
+    "💳 Transactions": render_transactions,
+    "📈 Statistiques": render_statistics,
+    "🚨 Détection de Fraude": render_fraud,
+    "👥 Clients": render_customers,
+    "🔍 Recherche Avancée": render_search,
+    "🧪 Test des Routes": render_route_tester,
+}
+
+
+# ==================== HEADER ====================
+
+st.title("🏦 Banking Transactions API - Interface de Test")
+st.markdown("---")
+
+# Vérification de l'état de l'API
+col1, col2, col3 = st.columns([2, 1, 1])
+
+with col1:
+    if check_api_health():
+        st.success("✅ API connectée et fonctionnelle")
+    else:
+        st.error("❌ API non accessible. Assurez-vous que l'API tourne sur http://localhost:8000")
+        st.info("💡 Lancez l'API avec : `uvicorn banking_api.main:app --reload`")
+        st.stop()
+
+with col2:
+    metadata = get_metadata()
+    if metadata:
+        st.info(f"📦 Version: {metadata.get('version', 'N/A')}")
+
+with col3:
+    st.info(f"🔗 Base URL: `{API_BASE_URL}`")
+
+st.markdown("---")
+
+
+# ==================== SIDEBAR ====================
+
+st.sidebar.title("📋 Navigation")
+menu = st.sidebar.radio("Choisissez une section :", list(PAGES))
+
+if st.sidebar.button("🔄 Rafraîchir les données"):
+    st.cache_data.clear()
+    for key in SESSION_DATA_ENDPOINTS:
+        st.session_state.pop(key, None)
+    st.rerun()
+
+st.sidebar.markdown("---")
+st.sidebar.markdown("### 🎯 Points testés")
+st.sidebar.markdown("""
+- ✅ GET /transactions
+- ✅ GET /stats/overview
+- ✅ GET /fraud/summary
+- ✅ POST /fraud/predict
+- ✅ GET /customers
+- ✅ POST /transactions/search
+""")
+
+
+# ==================== PAGE ACTIVE ====================
+
+PAGES[menu]()
+
+
 # ==================== FOOTER ====================
 
 st.markdown("---")